@@ -0,0 +1,374 @@
+"""
+Local load-testing harness for the HTTP server.
+
+Starts the server in a subprocess, replays a mix of `samples/` and synthetic
+documents against it, and reports latency percentiles, throughput, error
+rate and server RSS for every (document set, concurrency) step.
+
+Usage:
+    python -m benchmarks.loadtest --mode cli --concurrency 1,4,16 --duration 10
+    python -m benchmarks.loadtest --rate 20 --synthetic 10x100,100x2000 --json results.json
+
+Serving modes:
+    cli       python -m parser.cli --serve (the Docker entrypoint)
+    gunicorn  gunicorn "parser.server:create_app()" (only if gunicorn is installed)
+
+With --rate the load is open-loop: requests are scheduled at a fixed rate and
+latency is measured from the scheduled send time, so server stalls show up
+in the percentiles instead of silently lowering the offered load.
+"""
+import argparse
+import base64
+import glob
+import http.client
+import json
+import math
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+from benchmarks.synthetic import build_synthetic_docx
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "samples")
+SERVE_MODES = ("cli", "gunicorn")
+# High enough that the rate limiter never shapes the measured load.
+LOADTEST_RATE_LIMIT = "1000000/minute"
+
+
+def _free_port() -> int:
+    """Returns a TCP port that is currently free on localhost."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _server_command(mode: str, port: int, workers: int) -> List[str]:
+    """Builds the command line that starts the server in the given mode."""
+    if mode == "cli":
+        return [sys.executable, "-m", "parser.cli", "--serve"]
+    if mode == "gunicorn":
+        if shutil.which("gunicorn") is None:
+            raise RuntimeError("gunicorn is not installed. Please install it with 'pip install gunicorn'")
+        return [
+            "gunicorn", "--bind", f"127.0.0.1:{port}", "--workers", str(workers),
+            "--threads", "4", "parser.server:create_app()",
+        ]
+    raise ValueError(f"Unknown serve mode: {mode}")
+
+
+def _child_pids(pid: int) -> List[int]:
+    """Returns the direct children of a process, or [] if they cannot be listed."""
+    children = []
+    try:
+        tasks = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        return children
+    for task in tasks:
+        # /proc/<pid>/task/<tid>/children needs CONFIG_PROC_CHILDREN, and a
+        # task can exit mid-scan; either way the RSS already read is kept.
+        try:
+            with open(f"/proc/{pid}/task/{task}/children", "r") as f:
+                children.extend(int(child) for child in f.read().split())
+        except OSError:
+            continue
+    return children
+
+
+def _process_tree_rss(pid: int) -> Optional[int]:
+    """Returns the RSS in bytes of a process and its children, or None off Linux."""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status", "r") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        break
+        except OSError:
+            if current == pid:
+                return None
+            continue
+        pending.extend(_child_pids(current))
+    return total
+
+
+class ServerProcess:
+    """Runs the server in a subprocess for the duration of a `with` block."""
+
+    def __init__(self, mode: str, workers: int = 1, startup_timeout: float = 30.0):
+        self.mode = mode
+        self.port = _free_port()
+        self._command = _server_command(mode, self.port, workers)
+        self._startup_timeout = startup_timeout
+        self._process = None
+
+    def __enter__(self) -> "ServerProcess":
+        env = dict(os.environ, PORT=str(self.port), RATE_LIMIT=LOADTEST_RATE_LIMIT, LOG_LEVEL="WARNING")
+        self._process = subprocess.Popen(
+            self._command,
+            cwd=os.path.join(os.path.dirname(__file__), ".."),
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + self._startup_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"Server exited with code {self._process.returncode} during startup.")
+            try:
+                with socket.create_connection(("127.0.0.1", self.port), timeout=0.5):
+                    return self
+            except OSError:
+                time.sleep(0.1)
+        self.__exit__(None, None, None)
+        raise RuntimeError("Server did not start in time.")
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._process and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+    def rss(self) -> Optional[int]:
+        """Current RSS of the server process tree in bytes."""
+        return _process_tree_rss(self._process.pid)
+
+
+def _percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> dict:
+    """Summarizes request latencies (seconds) and errors of one step."""
+    ordered = sorted(latencies)
+    total = len(latencies) + errors
+
+    def ms(value):
+        return None if value is None else round(value * 1000, 2)
+
+    return {
+        "requests": total,
+        "errors": errors,
+        "errorRate": round(errors / total, 4) if total else 0.0,
+        "throughputRps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "p50Ms": ms(_percentile(ordered, 0.50)),
+        "p95Ms": ms(_percentile(ordered, 0.95)),
+        "p99Ms": ms(_percentile(ordered, 0.99)),
+        "maxMs": ms(ordered[-1] if ordered else None),
+    }
+
+
+def load_payloads(include_samples: bool, synthetic: List[str]) -> Dict[str, List[bytes]]:
+    """Builds the request bodies of every document set, keyed by set name."""
+    payload_sets = {}
+    if include_samples:
+        bodies = []
+        for path in sorted(glob.glob(os.path.join(SAMPLES_DIR, "*.docx"))):
+            with open(path, "rb") as f:
+                bodies.append(f.read())
+        payload_sets["samples"] = bodies
+    for spec in synthetic:
+        subjects, questions = (int(part) for part in spec.lower().split("x"))
+        payload_sets[f"synthetic-{spec}"] = [build_synthetic_docx(subjects, questions)]
+    return {
+        name: [json.dumps({"file": base64.b64encode(doc).decode("ascii")}).encode("utf-8") for doc in docs]
+        for name, docs in payload_sets.items()
+    }
+
+
+class _Client:
+    """Keep-alive HTTP client, one per worker thread."""
+
+    def __init__(self, port: int, endpoint: str):
+        self._port = port
+        self._endpoint = endpoint
+        self._local = threading.local()
+
+    def post(self, body: bytes) -> bool:
+        """Sends one request and returns whether it succeeded with a 2xx status."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = http.client.HTTPConnection("127.0.0.1", self._port, timeout=120)
+        try:
+            connection.request("POST", self._endpoint, body=body, headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            return 200 <= response.status < 300
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            self._local.connection = None
+            return False
+
+
+def run_step(server: ServerProcess, endpoint: str, bodies: List[bytes], concurrency: int,
+             duration: float, rate: Optional[float] = None, max_requests: Optional[int] = None) -> dict:
+    """
+    Runs one load step and returns its summary.
+
+    Closed-loop (rate is None): `concurrency` workers send back-to-back requests.
+    Open-loop: requests are scheduled at `rate` per second on `concurrency` workers.
+    """
+    client = _Client(server.port, endpoint)
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+    peak_rss = [server.rss()]
+    stop = threading.Event()
+
+    def sample_rss():
+        while not stop.wait(0.2):
+            rss = server.rss()
+            if rss is not None and (peak_rss[0] is None or rss > peak_rss[0]):
+                peak_rss[0] = rss
+
+    def record(ok: bool, latency: float):
+        nonlocal errors
+        with lock:
+            if ok:
+                latencies.append(latency)
+            else:
+                errors += 1
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    sampler.start()
+    start = time.perf_counter()
+    deadline = start + duration
+    sent = [0]
+
+    def take_ticket() -> Optional[int]:
+        with lock:
+            if max_requests is not None and sent[0] >= max_requests:
+                return None
+            sent[0] += 1
+            return sent[0] - 1
+
+    if rate is None:
+        def worker():
+            while time.perf_counter() < deadline:
+                ticket = take_ticket()
+                if ticket is None:
+                    return
+                t0 = time.perf_counter()
+                ok = client.post(bodies[ticket % len(bodies)])
+                record(ok, time.perf_counter() - t0)
+
+        threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    else:
+        def send(ticket: int, scheduled: float):
+            ok = client.post(bodies[ticket % len(bodies)])
+            record(ok, time.perf_counter() - scheduled)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            while True:
+                ticket = take_ticket()
+                if ticket is None:
+                    break
+                scheduled = start + ticket / rate
+                if scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(send, ticket, scheduled)
+
+    elapsed = time.perf_counter() - start
+    stop.set()
+    sampler.join()
+    summary = summarize(latencies, errors, elapsed)
+    summary["peakRssMb"] = None if peak_rss[0] is None else round(peak_rss[0] / (1024 * 1024), 1)
+    return summary
+
+
+def format_table(results: List[dict]) -> str:
+    """Renders step results as a plain-text table."""
+    columns = [
+        ("documents", "documents"), ("concurrency", "conc"), ("requests", "reqs"), ("errorRate", "err%"),
+        ("throughputRps", "rps"), ("p50Ms", "p50 ms"), ("p95Ms", "p95 ms"), ("p99Ms", "p99 ms"),
+        ("peakRssMb", "rss MB"),
+    ]
+    rows = [[title for _, title in columns]]
+    for result in results:
+        row = []
+        for key, _ in columns:
+            value = result.get(key)
+            if key == "errorRate":
+                value = f"{value * 100:.1f}"
+            row.append("-" if value is None else str(value))
+        rows.append(row)
+    widths = [max(len(row[i]) for row in rows) for i in range(len(columns))]
+    return "\n".join("  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in rows)
+
+
+def main():
+    """Runs the load test and prints the results."""
+    arg_parser = argparse.ArgumentParser(description="Local load test for the parser HTTP server.")
+    arg_parser.add_argument("--mode", choices=SERVE_MODES, default="cli", help="How to start the server.")
+    arg_parser.add_argument("--workers", type=int, default=2, help="Worker processes (gunicorn mode only).")
+    arg_parser.add_argument("--endpoint", choices=["/parse", "/validate"], default="/parse", help="Endpoint to load.")
+    arg_parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated concurrency levels.")
+    arg_parser.add_argument("--rate", type=float, help="Target requests per second (open-loop). Defaults to closed-loop.")
+    arg_parser.add_argument("--duration", type=float, default=10.0, help="Seconds per step.")
+    arg_parser.add_argument("--max-requests", type=int, help="Stop each step after this many requests.")
+    arg_parser.add_argument("--synthetic", default="10x100,100x2000",
+                            help="Comma-separated synthetic document sizes as SUBJECTSxQUESTIONS.")
+    arg_parser.add_argument("--no-samples", action="store_true", help="Do not replay the documents in samples/.")
+    arg_parser.add_argument("--json", help="Write machine-readable results to this path ('-' for stdout).")
+    args = arg_parser.parse_args()
+
+    synthetic = [spec for spec in args.synthetic.split(",") if spec]
+    payload_sets = load_payloads(not args.no_samples, synthetic)
+    if not payload_sets:
+        arg_parser.error("No documents to replay.")
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    results = []
+    with ServerProcess(args.mode, args.workers) as server:
+        idle_rss = server.rss()
+        for name, bodies in payload_sets.items():
+            for concurrency in levels:
+                summary = run_step(server, args.endpoint, bodies, concurrency, args.duration, args.rate, args.max_requests)
+                summary.update({
+                    "documents": name,
+                    "concurrency": concurrency,
+                    "avgRequestBytes": sum(len(body) for body in bodies) // len(bodies),
+                })
+                results.append(summary)
+                print(f"{name} @ {concurrency}: {summary['throughputRps']} rps, p95 {summary['p95Ms']} ms", file=sys.stderr)
+
+    report = {
+        "mode": args.mode,
+        "endpoint": args.endpoint,
+        "rate": args.rate,
+        "duration": args.duration,
+        "python": sys.version.split()[0],
+        "idleRssMb": None if idle_rss is None else round(idle_rss / (1024 * 1024), 1),
+        "results": results,
+    }
+    if args.json == "-":
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_table(results))
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
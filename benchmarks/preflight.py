@@ -0,0 +1,43 @@
+"""
+Compares the structure-only preflight with a full parse.
+
+Usage:
+    python -m benchmarks.preflight --subjects 200 --questions 3000
+"""
+import argparse
+import io
+import time
+from parser.extractor import check_docx, parse_docx
+from parser.schema import ParsedDocument, PreflightReport
+from benchmarks.synthetic import build_synthetic_docx
+
+
+def _best_of(func, repeat: int) -> float:
+    """Returns the fastest of `repeat` runs of func, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Runs the benchmark and prints the timings."""
+    arg_parser = argparse.ArgumentParser(description="Preflight vs full parse benchmark.")
+    arg_parser.add_argument("--subjects", type=int, default=200, help="Subjects in the synthetic document.")
+    arg_parser.add_argument("--questions", type=int, default=3000, help="Contest questions in the synthetic document.")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement.")
+    args = arg_parser.parse_args()
+
+    data = build_synthetic_docx(args.subjects, args.questions)
+    check = _best_of(lambda: PreflightReport(**check_docx(io.BytesIO(data))), args.repeat)
+    parse = _best_of(lambda: ParsedDocument(**parse_docx(io.BytesIO(data))), args.repeat)
+    print(f"{'mode':>8} {'seconds':>10}")
+    print(f"{'check':>8} {check:>10.3f}")
+    print(f"{'parse':>8} {parse:>10.3f}")
+    print(f"speedup: {parse / check:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
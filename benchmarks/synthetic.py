@@ -0,0 +1,58 @@
+"""
+Generates synthetic documents in the Markdown-like format for benchmarks and tests.
+"""
+import io
+from docx import Document
+
+
+def build_synthetic_lines(subjects: int = 20, questions: int = 200) -> list:
+    """Builds the paragraph lines of a synthetic notebook."""
+    lines = [
+        "# Curso: [Synthetic Course]",
+        "## Caderno: [Synthetic Notebook]",
+        "## Conteúdo Programático:",
+        "Synthetic programmatic content.",
+    ]
+    for s in range(1, subjects + 1):
+        lines += [
+            f"## Assunto {s}: [Subject {s}]",
+            "### Título do Slide (Teoria):",
+            f"Theory title {s}",
+            f"Theory content for subject {s}. " * 8,
+            "### Enunciado do Exercício:",
+            f"Solve the exercise of subject {s}.",
+            "### Questões do Exercício:",
+            "a) First question?",
+            ">yes",
+            "b) Second question?",
+            ">no",
+        ]
+    lines.append("## Questões de Concurso")
+    for q in range(1, questions + 1):
+        lines += [
+            f"### Questão {q}",
+            f"**Enunciado da Questão:** (CESPE/2024) Synthetic contest question {q}.",
+            "**Texto:** []",
+            "### Alternativas:",
+            "- A) Option A",
+            "- B) Option B (gabarito)",
+            "- C) Option C",
+            "- D) Option D",
+            "- E) Option E",
+        ]
+    return lines
+
+
+def build_docx(lines: list) -> bytes:
+    """Builds a .docx document with one paragraph per line and returns its bytes."""
+    document = Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def build_synthetic_docx(subjects: int = 20, questions: int = 200) -> bytes:
+    """Builds a synthetic .docx document and returns its bytes."""
+    return build_docx(build_synthetic_lines(subjects, questions))
@@ -0,0 +1,59 @@
+"""
+Thread-scaling benchmark for a shared DocxParser instance.
+
+Usage:
+    python -m benchmarks.thread_scaling --docs 32 --subjects 20 --questions 200
+
+On a free-threaded Python build (e.g. python3.13t) the parsing work runs in
+parallel. On a regular build the GIL serializes most of the work, so expect
+throughput to stay roughly flat as threads are added.
+"""
+import argparse
+import os
+import sys
+import sysconfig
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from parser.extractor import DocxParser
+from benchmarks.synthetic import build_synthetic_docx
+
+
+def _run(parser: DocxParser, paths: list, workers: int) -> float:
+    """Parses all paths with the given number of threads and returns the elapsed time."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(parser.parse, paths))
+    return time.perf_counter() - start
+
+
+def main():
+    """Runs the benchmark and prints a scaling table."""
+    arg_parser = argparse.ArgumentParser(description="Thread-scaling benchmark for DocxParser.")
+    arg_parser.add_argument("--docs", type=int, default=32, help="Number of documents parsed per run.")
+    arg_parser.add_argument("--subjects", type=int, default=20, help="Subjects per synthetic document.")
+    arg_parser.add_argument("--questions", type=int, default=200, help="Contest questions per synthetic document.")
+    arg_parser.add_argument("--threads", default="1,2,4,8", help="Comma-separated thread counts.")
+    args = arg_parser.parse_args()
+
+    gil_disabled = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    print(f"Python {sys.version.split()[0]}, free-threaded build: {gil_disabled}")
+
+    parser = DocxParser()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "synthetic.docx")
+        with open(path, "wb") as f:
+            f.write(build_synthetic_docx(args.subjects, args.questions))
+        paths = [path] * args.docs
+
+        _run(parser, paths[:1], 1)  # warm-up
+        baseline = None
+        print(f"{'threads':>8} {'seconds':>10} {'docs/s':>10} {'speedup':>8}")
+        for workers in (int(t) for t in args.threads.split(",")):
+            elapsed = _run(parser, paths, workers)
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>10.3f} {args.docs / elapsed:>10.1f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
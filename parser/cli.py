@@ -6,8 +6,30 @@ import json
 import sys
 import os
 import logging
-from parser.extractor import parse_docx
-from parser.schema import ParsedDocument
+from pydantic import ValidationError
+from parser.delta import diff_documents
+from parser.extractor import InvalidDocxError, check_docx, open_docx_source, parse_docx
+from parser.schema import ParsedDocument, PreflightReport
+from parser.shards import DEFAULT_SHARD_SIZE, write_shards
+
+
+def _load_previous(path: str) -> dict:
+    """
+    Loads a previous JSON output and normalizes it through ParsedDocument.
+
+    Raises ValueError with a readable message if it is not a parsed document.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Could not read {path}: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"{path} is not a parsed document object.")
+    try:
+        return ParsedDocument(**data).model_dump(by_alias=True)
+    except ValidationError as e:
+        raise ValueError(f"{path} is not a valid parsed document: {e}") from e
 
 
 def main():
@@ -23,10 +45,31 @@ def main():
         sys.stdout.reconfigure(encoding='utf-8')
 
     parser = argparse.ArgumentParser(description="Parse a .docx file to a canonical JSON format.")
-    parser.add_argument("-i", "--input", help="Path to the .docx file. Required if not in serve mode.")
+    parser.add_argument("-i", "--input", help="Path to the .docx file, or '-' to read it from stdin. Required if not in serve mode.")
     parser.add_argument("-o", "--output", help="Path to the output .json file. Defaults to stdout.")
     parser.add_argument("--json-indent", type=int, default=2, help="Indentation for the JSON output.")
     parser.add_argument("--serve", action="store_true", help="Run as a web server.")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Only check the document structure and print counts and warnings. Exits with 2 if the document is not valid.",
+    )
+    parser.add_argument(
+        "--previous",
+        help="Path to a previous JSON output of the same notebook. Emits a delta against it instead of the full document.",
+    )
+    parser.add_argument(
+        "--layout",
+        choices=["single", "sharded"],
+        default="single",
+        help="Output layout. 'sharded' writes per-subject and contest-question shards plus a manifest into --output.",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help="Number of contest questions per shard in the sharded layout.",
+    )
     
     args = parser.parse_args()
 
@@ -44,20 +87,56 @@ def main():
 
     if not args.input:
         parser.error("--input is required when not in --serve mode.")
+    if args.layout == "sharded" and not args.output:
+        parser.error("--output directory is required with --layout sharded.")
+    if args.shard_size < 1:
+        parser.error("--shard-size must be a positive integer.")
+    if args.previous and args.layout == "sharded":
+        parser.error("--previous cannot be combined with --layout sharded.")
+
+    input_name = "<stdin>" if args.input == "-" else args.input
+    try:
+        source = open_docx_source(sys.stdin.buffer if args.input == "-" else args.input)
+    except InvalidDocxError as e:
+        logging.error(f"Invalid input {input_name}: {e}")
+        sys.exit(1)
+
+    previous_data = None
+    if args.previous:
+        try:
+            previous_data = _load_previous(args.previous)
+        except ValueError as e:
+            logging.error(f"Invalid --previous: {e}")
+            sys.exit(1)
+
+    if args.check:
+        logging.info(f"Checking document: {input_name}")
+        report = PreflightReport(**check_docx(source))
+        print(report.model_dump_json(indent=args.json_indent))
+        sys.exit(0 if report.valid else 2)
 
     try:
-        logging.info(f"Parsing document: {args.input}")
-        parsed_data = parse_docx(args.input)
+        logging.info(f"Parsing document: {input_name}")
+        parsed_data = parse_docx(source)
         
         # Validate with Pydantic
         validated_data = ParsedDocument(**parsed_data)
+
+        if args.layout == "sharded":
+            manifest = write_shards(validated_data.model_dump(by_alias=True), args.output, args.shard_size)
+            logging.info(f"Successfully parsed {input_name} into {len(manifest['shards'])} shards in {args.output}")
+            return
         
-        output_json = validated_data.model_dump_json(indent=args.json_indent, by_alias=True)
+        if previous_data is not None:
+            delta = diff_documents(previous_data, validated_data.model_dump(by_alias=True))
+            output_json = json.dumps(delta, indent=args.json_indent, ensure_ascii=False)
+        else:
+            output_json = validated_data.model_dump_json(indent=args.json_indent, by_alias=True)
 
         if args.output:
             with open(args.output, "w", encoding="utf-8") as f:
                 f.write(output_json)
-            logging.info(f"Successfully parsed {args.input} to {args.output}")
+            logging.info(f"Successfully parsed {input_name} to {args.output}")
         else:
             # For stdout, we keep the print to just output the JSON
             print(output_json)
@@ -0,0 +1,119 @@
+"""
+Delta between two parses of the same notebook.
+
+Subjects are keyed by `subjectName` and contest questions by `id`, so a
+delta only carries the items that were added, removed or changed. When a
+key repeats inside one document, its later copies are told apart by an
+`occurrence` counter. Diffing uses dictionaries keyed this way and runs in
+time linear in the size of both documents.
+"""
+import hashlib
+import json
+from typing import Dict, Hashable, List, Tuple
+
+DELTA_FORMAT = "parser-word-json/delta"
+DELTA_VERSION = 1
+HEADER_FIELDS = ("courseTitle", "notebookTitle", "programmaticContent", "warnings")
+COLLECTIONS = (("subjects", "subjectName"), ("contestQuestions", "id"))
+
+
+def document_sha256(document: dict) -> str:
+    """Returns the SHA-256 of the canonical JSON form of a parsed document."""
+    canonical = json.dumps(document, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _keyed(items: List[dict], key_field: str) -> Dict[Tuple[Hashable, int], dict]:
+    """Indexes items by (key, occurrence), preserving their order."""
+    seen: Dict[Hashable, int] = {}
+    keyed = {}
+    for item in items:
+        key = item.get(key_field)
+        occurrence = seen.get(key, 0)
+        seen[key] = occurrence + 1
+        keyed[(key, occurrence)] = item
+    return keyed
+
+
+def _ref(key: Tuple[Hashable, int]) -> dict:
+    """Serializes an internal (key, occurrence) pair."""
+    ref = {"key": key[0]}
+    if key[1]:
+        ref["occurrence"] = key[1]
+    return ref
+
+
+def _unref(ref: dict) -> Tuple[Hashable, int]:
+    """Parses a serialized key reference."""
+    return ref["key"], ref.get("occurrence", 0)
+
+
+def _diff_collection(old_items: List[dict], new_items: List[dict], key_field: str) -> dict:
+    """Diffs two keyed lists of items."""
+    old = _keyed(old_items, key_field)
+    new = _keyed(new_items, key_field)
+
+    added = [dict(_ref(key), value=item) for key, item in new.items() if key not in old]
+    removed = [_ref(key) for key in old if key not in new]
+    changed = [dict(_ref(key), value=item) for key, item in new.items() if key in old and old[key] != item]
+
+    diff = {"added": added, "removed": removed, "changed": changed}
+    # Only spell out the order when applying the delta would not reproduce it,
+    # i.e. when surviving items were reordered or additions are not appended.
+    default_order = [key for key in old if key in new] + [key for key in new if key not in old]
+    if default_order != list(new):
+        diff["order"] = [_ref(key) for key in new]
+    return diff
+
+
+def diff_documents(old: dict, new: dict) -> dict:
+    """
+    Builds the delta that turns the parsed document `old` into `new`.
+    """
+    delta = {
+        "format": DELTA_FORMAT,
+        "version": DELTA_VERSION,
+        "baseSha256": document_sha256(old),
+        "targetSha256": document_sha256(new),
+        "fields": {field: new.get(field) for field in HEADER_FIELDS if old.get(field) != new.get(field)},
+    }
+    for collection, key_field in COLLECTIONS:
+        delta[collection] = _diff_collection(old.get(collection, []), new.get(collection, []), key_field)
+    return delta
+
+
+def is_empty_delta(delta: dict) -> bool:
+    """Returns True if the delta carries no change."""
+    return delta["baseSha256"] == delta["targetSha256"]
+
+
+def apply_delta(old: dict, delta: dict) -> dict:
+    """
+    Applies a delta produced by diff_documents to the document it was built from.
+
+    Raises ValueError if `old` is not the base the delta was computed against.
+    """
+    if delta.get("format") != DELTA_FORMAT or delta.get("version") != DELTA_VERSION:
+        raise ValueError("Unsupported delta format.")
+    if document_sha256(old) != delta["baseSha256"]:
+        raise ValueError("Delta does not apply to this document (base hash mismatch).")
+
+    new = dict(old)
+    new.update(delta["fields"])
+    for collection, key_field in COLLECTIONS:
+        diff = delta[collection]
+        items = _keyed(old.get(collection, []), key_field)
+        for ref in diff["removed"]:
+            items.pop(_unref(ref), None)
+        for entry in diff["changed"]:
+            items[_unref(entry)] = entry["value"]
+        for entry in diff["added"]:
+            items[_unref(entry)] = entry["value"]
+        if "order" in diff:
+            new[collection] = [items[_unref(ref)] for ref in diff["order"]]
+        else:
+            new[collection] = list(items.values())
+
+    if document_sha256(new) != delta["targetSha256"]:
+        raise ValueError("Applying the delta did not reproduce the target document.")
+    return new
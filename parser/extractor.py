@@ -1,8 +1,12 @@
 """
 Core parsing logic for DOCX files based on a new Markdown-like format.
 """
+import io
+import os
 import re
-from typing import List, Tuple
+import zipfile
+from types import MappingProxyType
+from typing import BinaryIO, Dict, List, Mapping, Optional, Union
 from docx import Document
 from docx.text.paragraph import Paragraph
 from parser.schema import (
@@ -13,6 +17,7 @@ from parser.schema import (
     ExerciseQuestion,
     ContestQuestion,
 )
+from lxml import etree
 
 # Regex patterns for the new format
 COURSE_PATTERN = r"^#\s*Curso:\s*\[?([^\]]+)\]?$"
@@ -34,249 +39,648 @@ OPTION_PATTERN = r"^-\s*([A-E])\)\s*(.+)$"
 EMPTY_TEXT_PATTERN = r"^\[\]$"
 
 
+EXAM_SOURCE_PATTERN = r"\(([^)]+)\)"
+
+# Named grammar used by DocxParser; names can be overridden per parser instance.
+GRAMMAR: Mapping[str, str] = MappingProxyType({
+    "course": COURSE_PATTERN,
+    "notebook": NOTEBOOK_PATTERN,
+    "programmatic_content": PROGRAMMATIC_CONTENT_PATTERN,
+    "subject": SUBJECT_PATTERN,
+    "theory_slide": THEORY_SLIDE_PATTERN,
+    "exercise_statement": EXERCISE_STATEMENT_PATTERN,
+    "exercise_questions": EXERCISE_QUESTIONS_PATTERN,
+    "simple_question": SIMPLE_QUESTION_PATTERN,
+    "simple_answer": SIMPLE_ANSWER_PATTERN,
+    "contest_questions_section": CONTEST_QUESTIONS_SECTION_PATTERN,
+    "contest_question_id": CONTEST_QUESTION_ID_PATTERN,
+    "contest_statement": CONTEST_STATEMENT_PATTERN,
+    "contest_text": CONTEST_TEXT_PATTERN,
+    "contest_alternatives": CONTEST_ALTERNATIVES_PATTERN,
+    "option_with_answer": OPTION_WITH_ANSWER_PATTERN,
+    "option": OPTION_PATTERN,
+    "empty_text": EMPTY_TEXT_PATTERN,
+    "exam_source": EXAM_SOURCE_PATTERN,
+})
+
+
+# Anything parse_docx/check_docx accept: a filesystem path, the raw bytes of
+# the document, or a binary file-like object.
+DocxSource = Union[str, os.PathLike, bytes, bytearray, memoryview, BinaryIO]
+
+
+class InvalidDocxError(ValueError):
+    """Raised when an input is not a readable .docx (zip) document."""
+
+
+class _BufferReader(io.RawIOBase):
+    """Read-only, seekable stream over a bytes-like object that does not copy it."""
+
+    def __init__(self, buffer):
+        super().__init__()
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        chunk = self._view[self._position : self._position + len(b)]
+        size = len(chunk)
+        b[:size] = chunk
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise OSError("Negative seek position.")
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+
+def open_docx_source(source: DocxSource) -> Union[str, BinaryIO]:
+    """
+    Normalizes a DocxSource and checks that it is a .docx before any parsing.
+
+    Returns a path or a seekable binary stream that python-docx and zipfile
+    can read. Bytes-like inputs are wrapped without copying; non-seekable
+    streams (e.g. stdin) are read into memory once.
+    Raises InvalidDocxError if the input is not a zip archive or lacks
+    word/document.xml, and TypeError for unsupported input types.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        source = os.fspath(source)
+        if not os.path.isfile(source):
+            raise InvalidDocxError(f"File not found: '{source}'.")
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BufferedReader(_BufferReader(source))
+    elif hasattr(source, "read"):
+        if not (hasattr(source, "seekable") and source.seekable()):
+            source = io.BufferedReader(_BufferReader(source.read()))
+    else:
+        raise TypeError(f"Unsupported input type: {type(source).__name__}")
+
+    position = None if isinstance(source, str) else source.tell()
+    try:
+        if not zipfile.is_zipfile(source):
+            raise InvalidDocxError("Input is not a valid zip archive.")
+        if position is not None:
+            source.seek(position)
+        with zipfile.ZipFile(source) as archive:
+            if "word/document.xml" not in archive.namelist():
+                raise InvalidDocxError("Input is a zip archive but not a .docx (missing word/document.xml).")
+    finally:
+        if position is not None:
+            source.seek(position)
+    return source
+
+
 def _clean_text(text: str) -> str:
     """Removes leading/trailing brackets and whitespace."""
     return text.strip().strip("[]").strip()
 
 
-def _extract_exam_source(statement: str) -> str:
-    """Extracts exam source like (CESPE/2024) from statement."""
-    match = re.search(r"\(([^)]+)\)", statement)
-    return match.group(1) if match else ""
-
-
 def _parse_paragraph_text(paragraphs: List[Paragraph]) -> List[str]:
     """Extracts stripped text from a list of Paragraph objects."""
-    return [p.text.strip() for p in paragraphs if p.text.strip()]
+    lines = []
+    for p in paragraphs:
+        text = p.text.strip()
+        if text:
+            lines.append(text)
+    return lines
+
+
+# Renders body-level paragraphs the way python-docx's Paragraph.text does, one
+# per output line. Line breaks inside a paragraph become U+2028 so they do not
+# split the paragraph; they are turned back into "\n" when reading. Page and
+# column breaks render as nothing, as in python-docx.
+_PARAGRAPH_TEXT_XSLT = b"""<xsl:stylesheet version="1.0"
+    xmlns:xsl="http://www.w3.org/1999/XSL/Transform"
+    xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <xsl:output method="text" encoding="utf-8"/>
+  <xsl:template match="/">
+    <xsl:for-each select="w:document/w:body/w:p">
+      <xsl:for-each select="w:r/*|w:hyperlink/w:r/*">
+        <xsl:choose>
+          <xsl:when test="self::w:t"><xsl:value-of select="."/></xsl:when>
+          <xsl:when test="self::w:tab or self::w:ptab"><xsl:text>&#9;</xsl:text></xsl:when>
+          <xsl:when test="self::w:br[not(@w:type) or @w:type='textWrapping'] or self::w:cr"><xsl:text>&#8232;</xsl:text></xsl:when>
+          <xsl:when test="self::w:noBreakHyphen"><xsl:text>-</xsl:text></xsl:when>
+        </xsl:choose>
+      </xsl:for-each>
+      <xsl:text>&#10;</xsl:text>
+    </xsl:for-each>
+  </xsl:template>
+</xsl:stylesheet>"""
+_PARAGRAPH_TEXT_XSLT_TREE = etree.XML(_PARAGRAPH_TEXT_XSLT)
+
+
+def _read_docx_lines(source: Union[str, BinaryIO]) -> List[str]:
+    """
+    Reads the stripped, non-empty body paragraph texts of a .docx.
+
+    Transforms word/document.xml with lxml directly instead of building the
+    python-docx object tree, which makes it much cheaper for large documents.
+    """
+    with zipfile.ZipFile(source) as archive:
+        root = etree.fromstring(archive.read("word/document.xml"))
+    # Compiling is cheap, and a per-call XSLT keeps this safe to call from many threads.
+    text = str(etree.XSLT(_PARAGRAPH_TEXT_XSLT_TREE)(root))
+    lines = []
+    for line in text.split("\n"):
+        line = line.replace("\u2028", "\n").strip()
+        if line:
+            lines.append(line)
+    return lines
+
+
+# Grammar entries check_lines classifies lines with.
+_CHECK_PATTERNS = (
+    "course",
+    "notebook",
+    "programmatic_content",
+    "subject",
+    "theory_slide",
+    "exercise_statement",
+    "contest_questions_section",
+    "contest_question_id",
+    "contest_alternatives",
+    "option_with_answer",
+    "option",
+)
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    """Returns True if the pattern has an unescaped `|` outside groups and classes."""
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return True
+    return False
+
+
+def _literal_first_char(pattern: str) -> Optional[str]:
+    """
+    Returns the literal character every match of an anchored pattern starts
+    with, or None if the pattern does not start with a fixed character.
+    """
+    if not pattern.startswith("^") or _has_top_level_alternation(pattern):
+        return None
+    rest = pattern[1:]
+    if rest.startswith("\\"):
+        char, following = rest[1:2], rest[2:3]
+        if not char or char.isalnum():
+            return None
+    else:
+        char, following = rest[:1], rest[1:2]
+        if not char or char in ".^$*+?{}[]|()":
+            return None
+    if following and following in "*?{":
+        return None
+    return char
+
+
+class DocxParser:
+    """
+    Reusable parser for the Markdown-like DOCX format.
+
+    The grammar is compiled once in the constructor and never mutated
+    afterwards. Every call keeps its state (lines, warnings) in local
+    variables, so a single instance can be shared by many threads at once,
+    e.g. from a ThreadPoolExecutor or on a free-threaded Python build.
+    """
+
+    def __init__(self, patterns: Optional[Dict[str, str]] = None):
+        """
+        Compiles the grammar.
+
+        `patterns` optionally overrides entries of GRAMMAR by name.
+        """
+        patterns = patterns or {}
+        unknown = set(patterns) - set(GRAMMAR)
+        if unknown:
+            raise ValueError(f"Unknown grammar pattern(s): {', '.join(sorted(unknown))}")
+        merged = {**GRAMMAR, **patterns}
+        self._patterns: Mapping[str, re.Pattern] = MappingProxyType(
+            {name: re.compile(pattern) for name, pattern in merged.items()}
+        )
+        # Leading characters that a line must start with to match any pattern
+        # used by check_lines, or None when some pattern has no fixed one.
+        prefixes = {_literal_first_char(merged[name]) for name in _CHECK_PATTERNS}
+        self._check_prefixes = None if None in prefixes else tuple(sorted(prefixes))
+
+    @property
+    def patterns(self) -> Mapping[str, re.Pattern]:
+        """Read-only view of the compiled grammar."""
+        return self._patterns
+
+    def _match(self, name: str, line: str) -> Optional[re.Match]:
+        """Matches a line against a named grammar pattern."""
+        return self._patterns[name].match(line)
+
+    def _extract_exam_source(self, statement: str) -> str:
+        """Extracts exam source like (CESPE/2024) from statement."""
+        match = self._patterns["exam_source"].search(statement)
+        return match.group(1) if match else ""
+
+    def _find_next_section(self, lines: List[str], names: List[str]) -> int:
+        """Finds the index of the next line matching any of the named patterns."""
+        compiled = [self._patterns[name] for name in names]
+        for i, line in enumerate(lines):
+            if any(pattern.match(line) for pattern in compiled):
+                return i
+        return len(lines)
+
+    def extract_course_title(self, lines: List[str], warnings: List[str]) -> str:
+        """Extracts the course title."""
+        for line in lines:
+            match = self._match("course", line)
+            if match:
+                return _clean_text(match.group(1))
+        warnings.append("Course title not found.")
+        return ""
+
+    def extract_notebook_title(self, lines: List[str], warnings: List[str]) -> str:
+        """Extracts the notebook title."""
+        for line in lines:
+            match = self._match("notebook", line)
+            if match:
+                return _clean_text(match.group(1))
+        warnings.append("Notebook title not found.")
+        return ""
+
+    def extract_programmatic_content(self, lines: List[str], warnings: List[str]) -> str:
+        """Extracts the programmatic content."""
+        try:
+            start_index = lines.index(next(l for l in lines if self._match("programmatic_content", l))) + 1
+            end_index = self._find_next_section(lines[start_index:], ["subject", "contest_questions_section"])
+            content = "\n".join(lines[start_index : start_index + end_index]).strip()
+            if not content:
+                warnings.append("Programmatic content is empty.")
+            return content
+        except (StopIteration, ValueError):
+            warnings.append("Programmatic content section not found.")
+            return ""
+
+    def extract_exercises_from_subject(self, lines: List[str], warnings: List[str]) -> List[Exercise]:
+        """Extracts exercises from a subject's content."""
+        exercises = []
+        while True:
+            try:
+                statement_start = lines.index(next(l for l in lines if self._match("exercise_statement", l))) + 1
+                statement_end = lines.index(next(l for l in lines[statement_start:] if self._match("exercise_questions", l)))
+                statement = "\n".join(lines[statement_start:statement_end]).strip()
+
+                questions_start = statement_end + 1
+                questions_end = self._find_next_section(lines[questions_start:], ["theory_slide", "exercise_statement"])
+
+                questions_block = lines[questions_start : questions_start + questions_end]
+
+                exercise_questions = []
+                for i, line in enumerate(questions_block):
+                    if self._match("simple_question", line):
+                        question_text = _clean_text(line)
+                        answer = ""
+                        if i + 1 < len(questions_block):
+                            answer_match = self._match("simple_answer", questions_block[i+1])
+                            if answer_match:
+                                answer = answer_match.group(1)
+                        if not answer:
+                            warnings.append(f"Answer not found for question: '{question_text[:30]}...'")
+
+                        exercise_questions.append(ExerciseQuestion(question=question_text, answer=answer))
+
+                if not statement:
+                    warnings.append("Exercise found with empty statement.")
+                if not exercise_questions:
+                    warnings.append(f"No questions found for exercise with statement: '{statement[:30]}...'")
+
+                exercises.append(Exercise(statement=statement, questions=exercise_questions))
+                lines = lines[questions_start + questions_end:]
+            except (StopIteration, ValueError):
+                break
+        return exercises
+
+    def extract_theory_slides(self, lines: List[str], warnings: List[str]) -> List[TheorySlide]:
+        """Extracts theory slides from a subject's content."""
+        slides = []
+        while True:
+            try:
+                title_start = lines.index(next(l for l in lines if self._match("theory_slide", l))) + 1
+                # Assuming title is a single line
+                title = lines[title_start].strip()
+
+                content_start = title_start + 1
+                content_end = self._find_next_section(lines[content_start:], ["theory_slide", "exercise_statement"])
+                content = "\n".join(lines[content_start : content_start + content_end]).strip()
+
+                if not title:
+                    warnings.append("Theory slide found with empty title.")
+                if not content:
+                    warnings.append(f"Theory slide '{title}' has empty content.")
+
+                slides.append(TheorySlide(title=title, content=content))
+                lines = lines[content_start + content_end:]
+            except (StopIteration, ValueError):
+                break
+        return slides
+
+    def extract_subjects(self, lines: List[str], warnings: List[str]) -> List[Subject]:
+        """Extracts all subjects from the document."""
+        subjects = []
+        subject_indices = [i for i, line in enumerate(lines) if self._match("subject", line)]
+
+        for i, start_index in enumerate(subject_indices):
+            subject_match = self._match("subject", lines[start_index])
+            subject_name = _clean_text(subject_match.group(1))
+
+            end_index = subject_indices[i+1] if i + 1 < len(subject_indices) else self._find_next_section(lines[start_index+1:], ["contest_questions_section"]) + start_index + 1
+
+            subject_content = lines[start_index + 1 : end_index]
+
+            theory_slides = self.extract_theory_slides(subject_content, warnings)
+            exercises = self.extract_exercises_from_subject(subject_content, warnings)
+
+            if not theory_slides and not exercises:
+                warnings.append(f"Subject '{subject_name}' has no theory slides or exercises.")
+
+            subjects.append(
+                Subject(
+                    subjectName=subject_name,
+                    theorySlides=theory_slides,
+                    exercises=exercises,
+                )
+            )
+        return subjects
+
+    def extract_contest_questions(self, lines: List[str], warnings: List[str]) -> List[ContestQuestion]:
+        """Extracts all contest questions from the document."""
+        questions = []
+        try:
+            start_index = lines.index(next(l for l in lines if self._match("contest_questions_section", l))) + 1
+        except (StopIteration, ValueError):
+            return questions # No contest questions section found
+
+        question_indices = [i for i, line in enumerate(lines) if self._match("contest_question_id", line)]
+
+        for i, q_start_index in enumerate(question_indices):
+            id_match = self._match("contest_question_id", lines[q_start_index])
+            q_id = int(id_match.group(1))
+
+            q_end_index = question_indices[i+1] if i + 1 < len(question_indices) else len(lines)
+            q_content = lines[q_start_index + 1 : q_end_index]
 
+            statement, text, options, answer = "", "", [], ""
 
-def _find_next_section(lines: List[str], patterns: List[str]) -> int:
-    """Finds the index of the next line matching any of the given patterns."""
-    for i, line in enumerate(lines):
-        if any(re.match(pattern, line) for pattern in patterns):
-            return i
-    return len(lines)
+            try:
+                # Statement
+                statement_line = next(l for l in q_content if self._match("contest_statement", l))
+                statement = _clean_text(self._match("contest_statement", statement_line).group(1))
+
+                # Optional Text
+                text_line_index = next((i for i, l in enumerate(q_content) if self._match("contest_text", l)), -1)
+                if text_line_index != -1:
+                    text_content = self._match("contest_text", q_content[text_line_index]).group(1).strip()
+                    text = "" if self._match("empty_text", text_content) else text_content
+
+                # Alternatives
+                alternatives_start = next((i for i, l in enumerate(q_content) if self._match("contest_alternatives", l)), -1)
+                if alternatives_start != -1:
+                    for line in q_content[alternatives_start + 1:]:
+                        option_match = self._match("option", line)
+                        answer_match = self._match("option_with_answer", line)
+
+                        if answer_match:
+                            answer = answer_match.group(1)
+                            options.append(f"{answer_match.group(1)}) {answer_match.group(2)}")
+                        elif option_match:
+                            options.append(f"{option_match.group(1)}) {option_match.group(2)}")
+
+            except (StopIteration, ValueError):
+                warnings.append(f"Could not parse all parts of Contest Question ID {q_id}.")
+                continue
+
+            if not statement: warnings.append(f"Contest Question ID {q_id} is missing a statement.")
+            if not options: warnings.append(f"Contest Question ID {q_id} is missing options.")
+            if not answer: warnings.append(f"Contest Question ID {q_id} is missing an answer.")
+
+            questions.append(
+                ContestQuestion(
+                    id=q_id,
+                    statement=statement,
+                    text=text,
+                    source=self._extract_exam_source(statement),
+                    options=options,
+                    answer=answer,
+                )
+            )
+        return questions
+
+    def parse_lines(self, lines: List[str]) -> dict:
+        """
+        Parses already extracted paragraph lines into a dictionary conforming to the schema.
+        """
+        warnings = []
+
+        course_title = self.extract_course_title(lines, warnings)
+        notebook_title = self.extract_notebook_title(lines, warnings)
+        programmatic_content = self.extract_programmatic_content(lines, warnings)
+        subjects = self.extract_subjects(lines, warnings)
+        contest_questions = self.extract_contest_questions(lines, warnings)
+
+        # Final validation
+        if not subjects and not contest_questions:
+            warnings.append("No subjects or contest questions were found in the document.")
+
+        return {
+            "courseTitle": course_title,
+            "notebookTitle": notebook_title,
+            "programmaticContent": programmatic_content,
+            "subjects": [s.model_dump() for s in subjects],
+            "contestQuestions": [cq.model_dump() for cq in contest_questions],
+            "warnings": warnings,
+        }
+
+    def check_lines(self, lines: List[str]) -> dict:
+        """
+        Classifies lines and counts structural markers without building content.
+
+        Returns a dictionary conforming to PreflightReport.
+        """
+        report = {
+            "courseFound": False,
+            "notebookFound": False,
+            "programmaticContentFound": False,
+            "subjects": 0,
+            "theorySlides": 0,
+            "exercises": 0,
+            "contestQuestions": 0,
+            "questionsMissingAnswer": [],
+        }
+        contest_section_found = False
+        # One [id, options, has_answer] entry per "### Questão N" block, so
+        # repeated ids are checked independently like parse_lines does.
+        questions = []
+        current = None
+        in_alternatives = False
+
+        for line in lines:
+            if self._check_prefixes is not None and not line.startswith(self._check_prefixes):
+                continue
+
+            id_match = self._match("contest_question_id", line)
+            if id_match:
+                current = [int(id_match.group(1)), 0, False]
+                questions.append(current)
+                in_alternatives = False
+            elif self._match("contest_alternatives", line):
+                in_alternatives = current is not None
+            elif in_alternatives and self._match("option_with_answer", line):
+                current[1] += 1
+                current[2] = True
+            elif in_alternatives and self._match("option", line):
+                current[1] += 1
+            elif self._match("subject", line):
+                report["subjects"] += 1
+            elif self._match("theory_slide", line):
+                report["theorySlides"] += 1
+            elif self._match("exercise_statement", line):
+                report["exercises"] += 1
+            elif self._match("contest_questions_section", line):
+                contest_section_found = True
+            elif self._match("course", line):
+                report["courseFound"] = True
+            elif self._match("notebook", line):
+                report["notebookFound"] = True
+            elif self._match("programmatic_content", line):
+                report["programmaticContentFound"] = True
+
+        warnings = []
+        if not report["courseFound"]:
+            warnings.append("Course title not found.")
+        if not report["notebookFound"]:
+            warnings.append("Notebook title not found.")
+        if not report["programmaticContentFound"]:
+            warnings.append("Programmatic content section not found.")
+        if contest_section_found:
+            report["contestQuestions"] = len(questions)
+            for q_id, options, has_answer in questions:
+                if not options:
+                    warnings.append(f"Contest Question ID {q_id} is missing options.")
+                if not has_answer:
+                    warnings.append(f"Contest Question ID {q_id} is missing an answer.")
+                    report["questionsMissingAnswer"].append(q_id)
+        if not report["subjects"] and not report["contestQuestions"]:
+            warnings.append("No subjects or contest questions were found in the document.")
+
+        report["warnings"] = warnings
+        report["valid"] = not warnings
+        return report
+
+    def check(self, source: DocxSource) -> dict:
+        """
+        Runs a structure-only preflight of a .docx (path, bytes-like or binary file-like object).
+        """
+        try:
+            return self.check_lines(_read_docx_lines(open_docx_source(source)))
+        except Exception as e:
+            return {"warnings": [f"Failed to read DOCX file: {e}"]}
+
+    def parse(self, source: DocxSource) -> dict:
+        """
+        Parses a .docx (path, bytes-like or binary file-like object) and returns
+        a dictionary conforming to the new schema.
+        """
+        try:
+            document = Document(open_docx_source(source))
+            lines = _parse_paragraph_text(document.paragraphs)
+        except Exception as e:
+            return {"warnings": [f"Failed to read DOCX file: {e}"]}
+        return self.parse_lines(lines)
+
+
+# Shared default instance backing the module-level functions below.
+_DEFAULT_PARSER = DocxParser()
+
+
+def _extract_exam_source(statement: str) -> str:
+    """Extracts exam source like (CESPE/2024) from statement."""
+    return _DEFAULT_PARSER._extract_exam_source(statement)
 
 
 def extract_course_title(lines: List[str], warnings: List[str]) -> str:
     """Extracts the course title."""
-    for line in lines:
-        match = re.match(COURSE_PATTERN, line)
-        if match:
-            return _clean_text(match.group(1))
-    warnings.append("Course title not found.")
-    return ""
+    return _DEFAULT_PARSER.extract_course_title(lines, warnings)
 
 
 def extract_notebook_title(lines: List[str], warnings: List[str]) -> str:
     """Extracts the notebook title."""
-    for line in lines:
-        match = re.match(NOTEBOOK_PATTERN, line)
-        if match:
-            return _clean_text(match.group(1))
-    warnings.append("Notebook title not found.")
-    return ""
+    return _DEFAULT_PARSER.extract_notebook_title(lines, warnings)
 
 
 def extract_programmatic_content(lines: List[str], warnings: List[str]) -> str:
     """Extracts the programmatic content."""
-    try:
-        start_index = lines.index(next(l for l in lines if re.match(PROGRAMMATIC_CONTENT_PATTERN, l))) + 1
-        end_index = _find_next_section(lines[start_index:], [SUBJECT_PATTERN, CONTEST_QUESTIONS_SECTION_PATTERN])
-        content = "\n".join(lines[start_index : start_index + end_index]).strip()
-        if not content:
-            warnings.append("Programmatic content is empty.")
-        return content
-    except (StopIteration, ValueError):
-        warnings.append("Programmatic content section not found.")
-        return ""
+    return _DEFAULT_PARSER.extract_programmatic_content(lines, warnings)
 
 
 def extract_exercises_from_subject(lines: List[str], warnings: List[str]) -> List[Exercise]:
     """Extracts exercises from a subject's content."""
-    exercises = []
-    while True:
-        try:
-            statement_start = lines.index(next(l for l in lines if re.match(EXERCISE_STATEMENT_PATTERN, l))) + 1
-            statement_end = lines.index(next(l for l in lines[statement_start:] if re.match(EXERCISE_QUESTIONS_PATTERN, l)))
-            statement = "\n".join(lines[statement_start:statement_end]).strip()
-
-            questions_start = statement_end + 1
-            questions_end = _find_next_section(lines[questions_start:], [THEORY_SLIDE_PATTERN, EXERCISE_STATEMENT_PATTERN])
-            
-            questions_block = lines[questions_start : questions_start + questions_end]
-            
-            exercise_questions = []
-            for i, line in enumerate(questions_block):
-                if re.match(SIMPLE_QUESTION_PATTERN, line):
-                    question_text = _clean_text(line)
-                    answer = ""
-                    if i + 1 < len(questions_block):
-                        answer_match = re.match(SIMPLE_ANSWER_PATTERN, questions_block[i+1])
-                        if answer_match:
-                            answer = answer_match.group(1)
-                    if not answer:
-                        warnings.append(f"Answer not found for question: '{question_text[:30]}...'")
-                    
-                    exercise_questions.append(ExerciseQuestion(question=question_text, answer=answer))
-
-            if not statement:
-                warnings.append("Exercise found with empty statement.")
-            if not exercise_questions:
-                warnings.append(f"No questions found for exercise with statement: '{statement[:30]}...'")
-
-            exercises.append(Exercise(statement=statement, questions=exercise_questions))
-            lines = lines[questions_start + questions_end:]
-        except (StopIteration, ValueError):
-            break
-    return exercises
+    return _DEFAULT_PARSER.extract_exercises_from_subject(lines, warnings)
 
 
 def extract_theory_slides(lines: List[str], warnings: List[str]) -> List[TheorySlide]:
     """Extracts theory slides from a subject's content."""
-    slides = []
-    while True:
-        try:
-            title_start = lines.index(next(l for l in lines if re.match(THEORY_SLIDE_PATTERN, l))) + 1
-            # Assuming title is a single line
-            title = lines[title_start].strip()
-            
-            content_start = title_start + 1
-            content_end = _find_next_section(lines[content_start:], [THEORY_SLIDE_PATTERN, EXERCISE_STATEMENT_PATTERN])
-            content = "\n".join(lines[content_start : content_start + content_end]).strip()
-
-            if not title:
-                warnings.append("Theory slide found with empty title.")
-            if not content:
-                warnings.append(f"Theory slide '{title}' has empty content.")
-
-            slides.append(TheorySlide(title=title, content=content))
-            lines = lines[content_start + content_end:]
-        except (StopIteration, ValueError):
-            break
-    return slides
+    return _DEFAULT_PARSER.extract_theory_slides(lines, warnings)
 
 
 def extract_subjects(lines: List[str], warnings: List[str]) -> List[Subject]:
     """Extracts all subjects from the document."""
-    subjects = []
-    subject_indices = [i for i, line in enumerate(lines) if re.match(SUBJECT_PATTERN, line)]
-    
-    for i, start_index in enumerate(subject_indices):
-        subject_match = re.match(SUBJECT_PATTERN, lines[start_index])
-        subject_name = _clean_text(subject_match.group(1))
-        
-        end_index = subject_indices[i+1] if i + 1 < len(subject_indices) else _find_next_section(lines[start_index+1:], [CONTEST_QUESTIONS_SECTION_PATTERN]) + start_index + 1
-        
-        subject_content = lines[start_index + 1 : end_index]
-        
-        theory_slides = extract_theory_slides(subject_content, warnings)
-        exercises = extract_exercises_from_subject(subject_content, warnings)
-
-        if not theory_slides and not exercises:
-            warnings.append(f"Subject '{subject_name}' has no theory slides or exercises.")
-
-        subjects.append(
-            Subject(
-                subjectName=subject_name,
-                theorySlides=theory_slides,
-                exercises=exercises,
-            )
-        )
-    return subjects
+    return _DEFAULT_PARSER.extract_subjects(lines, warnings)
 
 
 def extract_contest_questions(lines: List[str], warnings: List[str]) -> List[ContestQuestion]:
     """Extracts all contest questions from the document."""
-    questions = []
-    try:
-        start_index = lines.index(next(l for l in lines if re.match(CONTEST_QUESTIONS_SECTION_PATTERN, l))) + 1
-    except (StopIteration, ValueError):
-        return questions # No contest questions section found
-
-    question_indices = [i for i, line in enumerate(lines) if re.match(CONTEST_QUESTION_ID_PATTERN, line)]
+    return _DEFAULT_PARSER.extract_contest_questions(lines, warnings)
 
-    for i, q_start_index in enumerate(question_indices):
-        id_match = re.match(CONTEST_QUESTION_ID_PATTERN, lines[q_start_index])
-        q_id = int(id_match.group(1))
 
-        q_end_index = question_indices[i+1] if i + 1 < len(question_indices) else len(lines)
-        q_content = lines[q_start_index + 1 : q_end_index]
-
-        statement, text, options, answer = "", "", [], ""
-        
-        try:
-            # Statement
-            statement_line = next(l for l in q_content if re.match(CONTEST_STATEMENT_PATTERN, l))
-            statement = _clean_text(re.match(CONTEST_STATEMENT_PATTERN, statement_line).group(1))
-            
-            # Optional Text
-            text_line_index = next((i for i, l in enumerate(q_content) if re.match(CONTEST_TEXT_PATTERN, l)), -1)
-            if text_line_index != -1:
-                text_content = re.match(CONTEST_TEXT_PATTERN, q_content[text_line_index]).group(1).strip()
-                text = "" if re.match(EMPTY_TEXT_PATTERN, text_content) else text_content
-
-            # Alternatives
-            alternatives_start = next((i for i, l in enumerate(q_content) if re.match(CONTEST_ALTERNATIVES_PATTERN, l)), -1)
-            if alternatives_start != -1:
-                for line in q_content[alternatives_start + 1:]:
-                    option_match = re.match(OPTION_PATTERN, line)
-                    answer_match = re.match(OPTION_WITH_ANSWER_PATTERN, line)
-                    
-                    if answer_match:
-                        answer = answer_match.group(1)
-                        options.append(f"{answer_match.group(1)}) {answer_match.group(2)}")
-                    elif option_match:
-                        options.append(f"{option_match.group(1)}) {option_match.group(2)}")
-
-        except (StopIteration, ValueError):
-            warnings.append(f"Could not parse all parts of Contest Question ID {q_id}.")
-            continue
-
-        if not statement: warnings.append(f"Contest Question ID {q_id} is missing a statement.")
-        if not options: warnings.append(f"Contest Question ID {q_id} is missing options.")
-        if not answer: warnings.append(f"Contest Question ID {q_id} is missing an answer.")
-
-        questions.append(
-            ContestQuestion(
-                id=q_id,
-                statement=statement,
-                text=text,
-                source=_extract_exam_source(statement),
-                options=options,
-                answer=answer,
-            )
-        )
-    return questions
+def check_docx(source: DocxSource) -> dict:
+    """
+    Runs a structure-only preflight of a .docx and returns a dictionary conforming to PreflightReport.
+    """
+    return _DEFAULT_PARSER.check(source)
 
 
-def parse_docx(path: str) -> dict:
+def parse_docx(source: DocxSource) -> dict:
     """
-    Parses a .docx file and returns a dictionary conforming to the new schema.
+    Parses a .docx (path, bytes-like or binary file-like object) and returns
+    a dictionary conforming to the new schema.
     """
-    try:
-        document = Document(path)
-        lines = _parse_paragraph_text(list(document.paragraphs))
-    except Exception as e:
-        return {"warnings": [f"Failed to read DOCX file: {e}"]}
-
-    warnings = []
-
-    course_title = extract_course_title(lines, warnings)
-    notebook_title = extract_notebook_title(lines, warnings)
-    programmatic_content = extract_programmatic_content(lines, warnings)
-    subjects = extract_subjects(lines, warnings)
-    contest_questions = extract_contest_questions(lines, warnings)
-
-    # Final validation
-    if not subjects and not contest_questions:
-        warnings.append("No subjects or contest questions were found in the document.")
-
-    return {
-        "courseTitle": course_title,
-        "notebookTitle": notebook_title,
-        "programmaticContent": programmatic_content,
-        "subjects": [s.model_dump() for s in subjects],
-        "contestQuestions": [cq.model_dump() for cq in contest_questions],
-        "warnings": warnings,
-    }
+    return _DEFAULT_PARSER.parse(source)
@@ -34,8 +34,8 @@ class ContestQuestion(BaseModel):
     """Represents a single contest question."""
     id: int
     statement: str
-    text: Optional[str] = None
-    source: Optional[str] = None
+    text: Optional[str] = ""
+    source: Optional[str] = ""
     options: List[str]
     answer: str
 
@@ -47,4 +47,17 @@ class ParsedDocument(BaseModel):
     programmaticContent: str = Field(..., alias="programmaticContent")
     subjects: List[Subject] = Field(default_factory=list)
     contestQuestions: List[ContestQuestion] = Field(default_factory=list)
-    warnings: List[str] = Field(default_factory=list)
\ No newline at end of file
+    warnings: List[str] = Field(default_factory=list)
+
+class PreflightReport(BaseModel):
+    """Represents the structure-only summary of a document."""
+    valid: bool = False
+    courseFound: bool = False
+    notebookFound: bool = False
+    programmaticContentFound: bool = False
+    subjects: int = 0
+    theorySlides: int = 0
+    exercises: int = 0
+    contestQuestions: int = 0
+    questionsMissingAnswer: List[int] = Field(default_factory=list)
+    warnings: List[str] = Field(default_factory=list)
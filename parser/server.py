@@ -1,57 +1,200 @@
 import base64
-import tempfile
+import binascii
+import hashlib
 import os
 import logging
+import threading
+from collections import OrderedDict
 from flask import Flask, request, jsonify
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from parser.extractor import parse_docx
-from parser.schema import ParsedDocument
+from pydantic import ValidationError
+from parser.delta import diff_documents
+from parser.extractor import InvalidDocxError, check_docx, open_docx_source, parse_docx
+from parser.schema import ParsedDocument, PreflightReport
+from parser.shards import DEFAULT_SHARD_SIZE, build_shards
+
+# Off by default: each entry holds a full parsed document in memory.
+DEFAULT_RESULT_CACHE_SIZE = 0
+
+
+class ResultCache:
+    """
+    Bounded, thread-safe LRU cache of parsed documents.
+
+    Keys are the SHA-256 of the uploaded .docx bytes, so clients can also
+    compute the key of a file they parsed before. The cache lives in the
+    process memory: with several worker processes (e.g. gunicorn --workers N)
+    a key is only known to the worker that produced it, and other workers
+    answer 404; send the previous result itself with "previous" instead.
+
+    Every entry keeps a whole parsed document as Python objects, which takes
+    several times its JSON size; size max_entries for the largest notebooks
+    expected. A max_entries of 0 disables the cache.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_RESULT_CACHE_SIZE):
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """Returns the cached document for key, or None."""
+        with self._lock:
+            document = self._entries.get(key)
+            if document is not None:
+                self._entries.move_to_end(key)
+            return document
+
+    def put(self, key: str, document: dict):
+        """Stores a document, evicting the least recently used entries."""
+        if self._max_entries < 1:
+            return
+        with self._lock:
+            self._entries[key] = document
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+def _decode_file(encoded) -> bytes:
+    """
+    Decodes the base64 'file' field of a request body.
+
+    Raises ValueError with a client-facing message if it is not a base64 string.
+    """
+    if not isinstance(encoded, str):
+        raise ValueError("'file' must be a base64-encoded string.")
+    try:
+        return base64.b64decode(encoded)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid base64 in 'file': {e}") from e
+
 
 def create_app():
     """Creates a Flask app instance."""
     app = Flask(__name__)
+    result_cache = ResultCache(int(os.getenv("RESULT_CACHE_SIZE", DEFAULT_RESULT_CACHE_SIZE)))
 
     # Set up rate limiting
+    rate_limit = os.getenv("RATE_LIMIT", "60/minute")
     limiter = Limiter(
         get_remote_address,
         app=app,
-        default_limits=["60 per minute"],
+        default_limits=[rate_limit],
         storage_uri="memory://",
     )
 
     @app.route("/parse", methods=["POST"])
-    @limiter.limit("60/minute")
+    @limiter.limit(rate_limit)
     def parse_endpoint():
         """
         Parses a .docx file provided as a base64 string.
+
+        An optional "layout": "sharded" returns the manifest and the shards
+        (keyed by relative path, base64-encoded so the manifest's byte
+        offsets apply) instead of a single document.
+
+        An optional "previous" (an earlier result) or "previousKey" (the
+        X-Cache-Key of an earlier response) returns a delta against it instead.
+        The X-Cache-Key response header identifies this result for later deltas.
         """
         data = request.get_json()
         if not data or "file" not in data:
             return jsonify({"error": "Missing 'file' in request body."}), 400
 
+        layout = data.get("layout", "single")
+        if layout not in ("single", "sharded"):
+            return jsonify({"error": "Invalid 'layout'. Use 'single' or 'sharded'."}), 400
+        shard_size = data.get("shardSize", DEFAULT_SHARD_SIZE)
+        if isinstance(shard_size, bool) or not isinstance(shard_size, int) or shard_size < 1:
+            return jsonify({"error": "'shardSize' must be a positive integer."}), 400
+
+        previous_data = data.get("previous")
+        if previous_data is not None:
+            if not isinstance(previous_data, dict):
+                return jsonify({"error": "'previous' must be a parsed document object."}), 400
+            try:
+                # Diff against the normalized form so omitted optional fields
+                # or "1" vs 1 ids do not show up as changes.
+                previous_data = ParsedDocument(**previous_data).model_dump(by_alias=True)
+            except ValidationError as e:
+                return jsonify({"error": f"'previous' is not a valid parsed document: {e}"}), 400
+        if "previousKey" in data:
+            if not isinstance(data["previousKey"], str):
+                return jsonify({"error": "'previousKey' must be a string."}), 400
+            previous_data = result_cache.get(data["previousKey"])
+            if previous_data is None:
+                return jsonify({"error": "Unknown 'previousKey'."}), 404
+        if previous_data is not None and layout == "sharded":
+            return jsonify({"error": "A delta cannot be combined with the 'sharded' layout."}), 400
+
+        try:
+            decoded_file = _decode_file(data["file"])
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
         try:
-            decoded_file = base64.b64decode(data["file"])
-            
-            # Use a temporary file to save the docx content
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as temp_f:
-                temp_f.write(decoded_file)
-                temp_filepath = temp_f.name
-            
-            logging.info(f"Parsing temporary file: {temp_filepath}")
-            parsed_data = parse_docx(temp_filepath)
-            
-            os.remove(temp_filepath)
+            source = open_docx_source(decoded_file)
+        except InvalidDocxError as e:
+            return jsonify({"error": str(e)}), 400
+
+        try:
+            logging.info(f"Parsing document from request ({len(decoded_file)} bytes).")
+            parsed_data = parse_docx(source)
 
             # Validate and serialize
             validated_data = ParsedDocument(**parsed_data)
             logging.info("Successfully parsed document from request.")
-            return jsonify(validated_data.model_dump(by_alias=True))
+            document = validated_data.model_dump(by_alias=True)
+            cache_key = hashlib.sha256(decoded_file).hexdigest()
+            result_cache.put(cache_key, document)
+
+            if previous_data is not None:
+                response = jsonify(diff_documents(previous_data, document))
+            elif layout == "sharded":
+                manifest, shards = build_shards(document, shard_size)
+                response = jsonify({
+                    "manifest": manifest,
+                    "shards": {path: base64.b64encode(content).decode("ascii") for path, content in shards.items()},
+                })
+            else:
+                response = jsonify(document)
+            response.headers["X-Cache-Key"] = cache_key
+            return response
 
         except Exception as e:
             logging.error(f"An error occurred during parsing: {e}", exc_info=True)
             return jsonify({"error": str(e)}), 500
 
+    @app.route("/validate", methods=["POST"])
+    @limiter.limit(rate_limit)
+    def validate_endpoint():
+        """
+        Checks the structure of a .docx file provided as a base64 string
+        without building its content.
+        """
+        data = request.get_json()
+        if not data or "file" not in data:
+            return jsonify({"error": "Missing 'file' in request body."}), 400
+
+        try:
+            decoded_file = _decode_file(data["file"])
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+
+        try:
+            source = open_docx_source(decoded_file)
+        except InvalidDocxError as e:
+            return jsonify({"error": str(e)}), 400
+
+        try:
+            report = PreflightReport(**check_docx(source))
+            return jsonify(report.model_dump())
+        except Exception as e:
+            logging.error(f"An error occurred during validation: {e}", exc_info=True)
+            return jsonify({"error": str(e)}), 500
+
     return app
 
 if __name__ == "__main__":
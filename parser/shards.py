@@ -0,0 +1,147 @@
+"""
+Sharded output layout for large parsed documents.
+
+Instead of a single ``ParsedDocument`` JSON, the document is split into one
+shard per subject and one or more JSON Lines shards holding the contest
+questions. A ``manifest.json`` records, for every subject and question, the
+shard it lives in together with its byte offset, length and SHA-256 hash, so
+a consumer can fetch a single item without reading the rest of the output.
+"""
+import hashlib
+import json
+import os
+from typing import Dict, Tuple
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+DEFAULT_SHARD_SIZE = 500
+
+
+def _sha256(data: bytes) -> str:
+    """Returns the hex SHA-256 digest of the given bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _encode(item: dict) -> bytes:
+    """Serializes a single item as compact UTF-8 JSON."""
+    return json.dumps(item, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build_shards(document: dict, shard_size: int = DEFAULT_SHARD_SIZE) -> Tuple[dict, Dict[str, bytes]]:
+    """
+    Splits a parsed document into shards.
+
+    Returns the manifest and a mapping of relative shard path to shard bytes.
+    Contest questions are grouped ``shard_size`` per shard, one question per line.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be a positive integer.")
+
+    shards: Dict[str, bytes] = {}
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "courseTitle": document.get("courseTitle", ""),
+        "notebookTitle": document.get("notebookTitle", ""),
+        "programmaticContent": document.get("programmaticContent", ""),
+        "warnings": document.get("warnings", []),
+        "counts": {
+            "subjects": len(document.get("subjects", [])),
+            "contestQuestions": len(document.get("contestQuestions", [])),
+        },
+        "shards": [],
+        "subjects": [],
+        "contestQuestions": [],
+    }
+
+    for index, subject in enumerate(document.get("subjects", []), start=1):
+        path = f"subjects/{index:04d}.json"
+        data = _encode(subject)
+        shards[path] = data
+        manifest["shards"].append(
+            {"path": path, "kind": "subject", "count": 1, "bytes": len(data), "sha256": _sha256(data)}
+        )
+        manifest["subjects"].append(
+            {
+                "subjectName": subject.get("subjectName", ""),
+                "shard": path,
+                "offset": 0,
+                "length": len(data),
+                "sha256": _sha256(data),
+            }
+        )
+
+    questions = document.get("contestQuestions", [])
+    for shard_index, start in enumerate(range(0, len(questions), shard_size), start=1):
+        path = f"contest_questions/{shard_index:04d}.jsonl"
+        buffer = bytearray()
+        chunk = questions[start : start + shard_size]
+        for question in chunk:
+            line = _encode(question)
+            manifest["contestQuestions"].append(
+                {
+                    "id": question.get("id"),
+                    "shard": path,
+                    "offset": len(buffer),
+                    "length": len(line),
+                    "sha256": _sha256(line),
+                }
+            )
+            buffer += line + b"\n"
+        data = bytes(buffer)
+        shards[path] = data
+        manifest["shards"].append(
+            {"path": path, "kind": "contestQuestions", "count": len(chunk), "bytes": len(data), "sha256": _sha256(data)}
+        )
+
+    return manifest, shards
+
+
+def write_shards(document: dict, out_dir: str, shard_size: int = DEFAULT_SHARD_SIZE) -> dict:
+    """
+    Writes the sharded layout of a parsed document into ``out_dir``.
+
+    Returns the manifest, which is also written to ``out_dir/manifest.json``.
+    """
+    manifest, shards = build_shards(document, shard_size)
+    for path, data in shards.items():
+        full_path = os.path.join(out_dir, *path.split("/"))
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(data)
+    with open(os.path.join(out_dir, MANIFEST_FILENAME), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def _read_entry(out_dir: str, entry: dict) -> dict:
+    """Reads a single manifest entry from its shard and verifies its hash."""
+    with open(os.path.join(out_dir, *entry["shard"].split("/")), "rb") as f:
+        f.seek(entry["offset"])
+        data = f.read(entry["length"])
+    if _sha256(data) != entry["sha256"]:
+        raise ValueError(f"Hash mismatch for entry in shard '{entry['shard']}'.")
+    return json.loads(data)
+
+
+def load_manifest(out_dir: str) -> dict:
+    """Loads the manifest of a sharded output directory."""
+    with open(os.path.join(out_dir, MANIFEST_FILENAME), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_subject(out_dir: str, subject_name: str, manifest: dict = None) -> dict:
+    """Reads one subject by name from a sharded output directory."""
+    manifest = manifest or load_manifest(out_dir)
+    for entry in manifest["subjects"]:
+        if entry["subjectName"] == subject_name:
+            return _read_entry(out_dir, entry)
+    raise KeyError(f"Subject '{subject_name}' not found in manifest.")
+
+
+def read_contest_question(out_dir: str, question_id: int, manifest: dict = None) -> dict:
+    """Reads one contest question by id from a sharded output directory."""
+    manifest = manifest or load_manifest(out_dir)
+    for entry in manifest["contestQuestions"]:
+        if entry["id"] == question_id:
+            return _read_entry(out_dir, entry)
+    raise KeyError(f"Contest Question ID {question_id} not found in manifest.")
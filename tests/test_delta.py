@@ -0,0 +1,193 @@
+"""
+Tests for delta output between successive parses.
+"""
+import base64
+import copy
+import json
+import os
+import subprocess
+import sys
+import pytest
+from benchmarks.synthetic import build_docx
+from parser.delta import apply_delta, diff_documents, is_empty_delta
+from parser.server import create_app
+
+
+def _document():
+    """Builds a small parsed document."""
+    return {
+        "courseTitle": "Course",
+        "notebookTitle": "Notebook",
+        "programmaticContent": "Content",
+        "subjects": [
+            {"subjectName": "A", "theorySlides": [], "exercises": []},
+            {"subjectName": "B", "theorySlides": [], "exercises": []},
+            {"subjectName": "B", "theorySlides": [{"title": "t", "content": "c"}], "exercises": []},
+        ],
+        "contestQuestions": [
+            {"id": i, "statement": f"Q{i}", "text": "", "source": "", "options": ["A) a"], "answer": "A"}
+            for i in range(1, 4)
+        ],
+        "warnings": [],
+    }
+
+
+def test_identical_documents_give_empty_delta():
+    """
+    Tests that diffing a document with itself carries no change.
+    """
+    delta = diff_documents(_document(), _document())
+    assert is_empty_delta(delta)
+    assert delta["fields"] == {}
+    assert delta["subjects"] == {"added": [], "removed": [], "changed": []}
+
+
+def test_delta_roundtrip():
+    """
+    Tests that a delta only lists edited items and reproduces the new document.
+    """
+    old = _document()
+    new = copy.deepcopy(old)
+    new["notebookTitle"] = "Notebook v2"
+    new["subjects"][2]["theorySlides"][0]["content"] = "changed"
+    new["subjects"].insert(0, {"subjectName": "C", "theorySlides": [], "exercises": []})
+    del new["contestQuestions"][0]
+    new["contestQuestions"].append({"id": 9, "statement": "Q9", "text": "", "source": "", "options": [], "answer": ""})
+
+    delta = diff_documents(old, new)
+
+    assert delta["fields"] == {"notebookTitle": "Notebook v2"}
+    assert delta["subjects"]["changed"] == [{"key": "B", "occurrence": 1, "value": new["subjects"][3]}]
+    assert [entry["key"] for entry in delta["subjects"]["added"]] == ["C"]
+    assert "order" in delta["subjects"]
+    assert delta["contestQuestions"]["removed"] == [{"key": 1}]
+    assert [entry["key"] for entry in delta["contestQuestions"]["added"]] == [9]
+    assert "order" not in delta["contestQuestions"]
+    assert apply_delta(old, delta) == new
+
+
+def test_apply_delta_rejects_wrong_base():
+    """
+    Tests that a delta cannot be applied to a different document.
+    """
+    new = _document()
+    new["courseTitle"] = "Other"
+    delta = diff_documents(_document(), new)
+    with pytest.raises(ValueError):
+        apply_delta(new, delta)
+
+
+def _encoded_docx(lines):
+    """Builds a base64-encoded .docx from paragraph lines."""
+    return base64.b64encode(build_docx(lines)).decode("utf-8")
+
+
+def test_parse_endpoint_delta_by_cache_key(monkeypatch):
+    """
+    Tests that /parse returns a delta against an earlier result by its cache key.
+    """
+    monkeypatch.setenv("RESULT_CACHE_SIZE", "4")
+    client = create_app().test_client()
+    lines = ["# Curso: [Course]", "## Caderno: [Notebook]", "## Assunto 1: [A]"]
+    first = client.post("/parse", json={"file": _encoded_docx(lines)})
+    key = first.headers["X-Cache-Key"]
+
+    response = client.post("/parse", json={"file": _encoded_docx(lines + ["## Assunto 2: [B]"]), "previousKey": key})
+    delta = response.get_json()
+
+    assert response.status_code == 200
+    assert [entry["key"] for entry in delta["subjects"]["added"]] == ["B"]
+    assert apply_delta(first.get_json(), delta)["subjects"][1]["subjectName"] == "B"
+    assert client.post("/parse", json={"file": _encoded_docx(lines), "previousKey": "unknown"}).status_code == 404
+
+
+def test_parse_endpoint_rejects_malformed_previous():
+    """
+    Tests that a malformed "previous" or "previousKey" answers 400.
+    """
+    client = create_app().test_client()
+    encoded = _encoded_docx(["# Curso: [Course]"])
+
+    response = client.post("/parse", json={"file": encoded, "previous": {"subjects": ["x"]}})
+    assert response.status_code == 400
+    response = client.post("/parse", json={"file": encoded, "previousKey": ["not", "a", "key"]})
+    assert response.status_code == 400
+
+
+def test_parse_endpoint_normalizes_previous():
+    """
+    Tests that a previous document omitting optional fields gives an empty delta.
+    """
+    client = create_app().test_client()
+    lines = [
+        "# Curso: [Course]",
+        "## Caderno: [Notebook]",
+        "## Conteúdo Programático:",
+        "Content",
+        "## Questões de Concurso",
+        "### Questão 1",
+        "**Enunciado da Questão:** Question.",
+        "### Alternativas:",
+        "- A) Option (gabarito)",
+    ]
+    encoded = _encoded_docx(lines)
+    previous = client.post("/parse", json={"file": encoded}).get_json()
+    del previous["warnings"]
+    for question in previous["contestQuestions"]:
+        question.pop("text")
+        question.pop("source")
+        question["id"] = str(question["id"])
+
+    delta = client.post("/parse", json={"file": encoded, "previous": previous}).get_json()
+    assert delta["fields"] == {}
+    assert delta["contestQuestions"]["changed"] == []
+
+
+def test_result_cache_is_disabled_by_default(monkeypatch):
+    """
+    Tests that results are not cached unless RESULT_CACHE_SIZE is set.
+    """
+    monkeypatch.delenv("RESULT_CACHE_SIZE", raising=False)
+    client = create_app().test_client()
+    lines = ["# Curso: [Course]", "## Assunto 1: [A]"]
+    key = client.post("/parse", json={"file": _encoded_docx(lines)}).headers["X-Cache-Key"]
+
+    response = client.post("/parse", json={"file": _encoded_docx(lines), "previousKey": key})
+    assert response.status_code == 404
+
+
+def _run_cli(args):
+    """Runs the CLI from the repository root."""
+    return subprocess.run(
+        [sys.executable, "-m", "parser.cli", *args],
+        capture_output=True,
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+    )
+
+
+def test_cli_previous(tmp_path):
+    """
+    Tests that --previous emits a normalized delta and rejects invalid files.
+    """
+    lines = ["# Curso: [Course]", "## Caderno: [Notebook]", "## Assunto 1: [A]"]
+    old_path = tmp_path / "old.docx"
+    old_path.write_bytes(build_docx(lines))
+    new_path = tmp_path / "new.docx"
+    new_path.write_bytes(build_docx(lines + ["## Assunto 2: [B]"]))
+
+    previous = json.loads(_run_cli(["-i", str(old_path)]).stdout)
+    del previous["warnings"]
+    previous_path = tmp_path / "previous.json"
+    previous_path.write_text(json.dumps(previous), encoding="utf-8")
+
+    result = _run_cli(["-i", str(new_path), "--previous", str(previous_path)])
+    delta = json.loads(result.stdout)
+    assert result.returncode == 0
+    assert [entry["key"] for entry in delta["subjects"]["added"]] == ["B"]
+    assert delta["subjects"]["changed"] == []
+
+    previous_path.write_text("[1, 2]", encoding="utf-8")
+    result = _run_cli(["-i", str(new_path), "--previous", str(previous_path)])
+    assert result.returncode == 1
+    assert b"Invalid --previous" in result.stderr
+    assert b"Traceback" not in result.stderr
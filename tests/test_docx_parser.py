@@ -0,0 +1,52 @@
+"""
+Tests for the reusable DocxParser object.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from parser.extractor import DocxParser, parse_docx
+from benchmarks.synthetic import build_synthetic_lines
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "samples")
+NEW_DOCX_PATH = os.path.join(SAMPLES_DIR, "sample_new_format.docx")
+
+
+def test_parser_matches_module_function():
+    """
+    Tests that DocxParser.parse returns the same result as parse_docx.
+    """
+    assert DocxParser().parse(NEW_DOCX_PATH) == parse_docx(NEW_DOCX_PATH)
+
+
+def test_parser_pattern_override():
+    """
+    Tests that grammar patterns can be overridden and unknown names are rejected.
+    """
+    parser = DocxParser(patterns={"course": r"^#\s*Course:\s*\[?([^\]]+)\]?$"})
+    warnings = []
+    assert parser.extract_course_title(["# Course: [English]"], warnings) == "English"
+    assert warnings == []
+
+    with pytest.raises(ValueError):
+        DocxParser(patterns={"unknown": r".*"})
+
+
+def test_parser_is_thread_safe():
+    """
+    Stress test: a single instance shared by many threads returns the same
+    results as sequential calls, with no warnings leaking between calls.
+    """
+    parser = DocxParser()
+    inputs = [build_synthetic_lines(subjects=n % 5 + 1, questions=n % 7) for n in range(64)]
+    inputs += [["# Curso: [Only course]"]] * 16
+    expected = [parser.parse_lines(lines) for lines in inputs]
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        for _ in range(5):
+            results = list(executor.map(parser.parse_lines, inputs))
+            assert results == expected
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        docx_results = list(executor.map(parser.parse, [NEW_DOCX_PATH] * 32))
+    assert all(result == docx_results[0] for result in docx_results)
+    assert docx_results[0]["warnings"] == []
@@ -0,0 +1,102 @@
+"""
+Tests for the accepted input types of parse_docx and the CLI.
+"""
+import base64
+import io
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import zipfile
+import pytest
+from parser.extractor import InvalidDocxError, open_docx_source, parse_docx
+from parser.server import create_app
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "samples")
+NEW_DOCX_PATH = os.path.join(SAMPLES_DIR, "sample_new_format.docx")
+
+
+def _sample_bytes():
+    """Returns the raw bytes of the sample document."""
+    with open(NEW_DOCX_PATH, "rb") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize(
+    "make_source",
+    [
+        lambda data: pathlib.Path(NEW_DOCX_PATH),
+        lambda data: data,
+        lambda data: bytearray(data),
+        lambda data: memoryview(data),
+        lambda data: io.BytesIO(data),
+    ],
+    ids=["pathlike", "bytes", "bytearray", "memoryview", "filelike"],
+)
+def test_parse_docx_input_types(make_source):
+    """
+    Tests that every supported input type parses like the path does.
+    """
+    assert parse_docx(make_source(_sample_bytes())) == parse_docx(NEW_DOCX_PATH)
+
+
+def test_open_docx_source_rejects_invalid_input():
+    """
+    Tests that non-zip and non-docx inputs are reported before parsing.
+    """
+    with pytest.raises(InvalidDocxError, match="not a valid zip"):
+        open_docx_source(b"not a zip")
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as z:
+        z.writestr("hello.txt", "hello")
+    with pytest.raises(InvalidDocxError, match="not a .docx"):
+        open_docx_source(archive.getvalue())
+
+    assert parse_docx(b"not a zip")["warnings"] == ["Failed to read DOCX file: Input is not a valid zip archive."]
+
+
+def test_cli_reads_stdin():
+    """
+    Tests that the CLI reads the document from stdin with --input -.
+    """
+    result = subprocess.run(
+        [sys.executable, "-m", "parser.cli", "--input", "-"],
+        input=_sample_bytes(),
+        capture_output=True,
+        check=True,
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+    )
+    assert json.loads(result.stdout)["courseTitle"] == "Sample Course Name"
+
+    result = subprocess.run(
+        [sys.executable, "-m", "parser.cli", "--input", "-"],
+        input=b"not a zip",
+        capture_output=True,
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+    )
+    assert result.returncode == 1
+    assert b"not a valid zip" in result.stderr
+
+
+@pytest.mark.parametrize("endpoint", ["/parse", "/validate"])
+def test_parse_endpoint_rejects_invalid_docx(endpoint):
+    """
+    Tests that /parse and /validate answer 400 for inputs that are not a .docx.
+    """
+    client = create_app().test_client()
+    response = client.post(endpoint, json={"file": base64.b64encode(b"not a zip").decode("utf-8")})
+    assert response.status_code == 400
+    assert "not a valid zip" in response.get_json()["error"]
+
+
+@pytest.mark.parametrize("value", [123, None, ["x"]])
+def test_parse_endpoint_rejects_non_string_file(value):
+    """
+    Tests that /parse answers a JSON 400 when 'file' is not a string.
+    """
+    client = create_app().test_client()
+    response = client.post("/parse", json={"file": value})
+    assert response.status_code == 400
+    assert "must be a base64-encoded string" in response.get_json()["error"]
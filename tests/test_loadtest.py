@@ -0,0 +1,50 @@
+"""
+Tests for the local load-testing harness.
+"""
+import builtins
+import os
+import pytest
+from benchmarks.loadtest import ServerProcess, _process_tree_rss, format_table, run_step, summarize, load_payloads
+
+
+def test_summarize_percentiles():
+    """
+    Tests latency percentiles, throughput and error rate of a step summary.
+    """
+    latencies = [i / 1000 for i in range(1, 101)]
+    summary = summarize(latencies, errors=25, elapsed=2.0)
+
+    assert summary["requests"] == 125
+    assert summary["errorRate"] == 0.2
+    assert summary["throughputRps"] == 50.0
+    assert (summary["p50Ms"], summary["p95Ms"], summary["p99Ms"]) == (50.0, 95.0, 99.0)
+
+
+def test_run_step_against_local_server():
+    """
+    Tests a short closed-loop step against a locally started server.
+    """
+    bodies = load_payloads(include_samples=False, synthetic=["2x3"])["synthetic-2x3"]
+    with ServerProcess("cli") as server:
+        summary = run_step(server, "/parse", bodies, concurrency=2, duration=30, max_requests=6)
+
+    assert summary["requests"] == 6
+    assert summary["errors"] == 0
+    assert summary["p99Ms"] is not None
+    assert "p95 ms" in format_table([dict(summary, documents="synthetic-2x3", concurrency=2)])
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="requires /proc")
+def test_process_tree_rss_without_children_file(monkeypatch):
+    """
+    Tests that the root RSS is kept when /proc/<pid>/task/*/children is unavailable.
+    """
+    real_open = builtins.open
+
+    def fake_open(path, *args, **kwargs):
+        if str(path).endswith("/children"):
+            raise FileNotFoundError(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", fake_open)
+    assert _process_tree_rss(os.getpid()) > 0
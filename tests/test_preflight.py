@@ -0,0 +1,146 @@
+"""
+Tests for the structure-only preflight check.
+"""
+import base64
+import io
+import os
+from docx import Document
+from docx.enum.text import WD_BREAK
+from benchmarks.synthetic import build_docx
+from parser.extractor import DocxParser, _parse_paragraph_text, _read_docx_lines, check_docx, parse_docx
+from parser.schema import PreflightReport
+from parser.server import create_app
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "samples")
+NEW_DOCX_PATH = os.path.join(SAMPLES_DIR, "sample_new_format.docx")
+
+
+def test_check_sample_document():
+    """
+    Tests that the preflight counts match the full parse of the sample.
+    """
+    report = PreflightReport(**check_docx(NEW_DOCX_PATH))
+    parsed = parse_docx(NEW_DOCX_PATH)
+
+    assert report.valid
+    assert report.courseFound and report.notebookFound and report.programmaticContentFound
+    assert report.subjects == len(parsed["subjects"])
+    assert report.contestQuestions == len(parsed["contestQuestions"])
+    assert report.theorySlides == 1
+    assert report.exercises == 1
+    assert report.warnings == []
+
+
+def test_check_missing_gabarito():
+    """
+    Tests that alternatives without a (gabarito) are reported.
+    """
+    lines = [
+        "## Questões de Concurso",
+        "### Questão 7",
+        "**Enunciado da Questão:** (FCC/2023) Question.",
+        "### Alternativas:",
+        "- A) Option A",
+        "- B) Option B",
+    ]
+    report = DocxParser().check_lines(lines)
+
+    assert not report["valid"]
+    assert report["contestQuestions"] == 1
+    assert report["questionsMissingAnswer"] == [7]
+    assert "Contest Question ID 7 is missing an answer." in report["warnings"]
+    assert "Course title not found." in report["warnings"]
+
+
+def test_check_invalid_file():
+    """
+    Tests that a non-docx input is reported as a warning.
+    """
+    report = PreflightReport(**check_docx(io.BytesIO(b"not a zip")))
+    assert not report.valid
+    assert report.warnings[0].startswith("Failed to read DOCX file")
+
+
+def test_validate_endpoint():
+    """
+    Tests the /validate endpoint.
+    """
+    client = create_app().test_client()
+    encoded = base64.b64encode(build_docx(["# Curso: [Course]"])).decode("utf-8")
+    response = client.post("/validate", json={"file": encoded})
+
+    assert response.status_code == 200
+    assert response.get_json()["courseFound"] is True
+    assert response.get_json()["valid"] is False
+    assert client.post("/validate", json={}).status_code == 400
+
+
+def test_check_duplicate_question_ids():
+    """
+    Tests that repeated question ids are checked per block, like parse_lines.
+    """
+    lines = [
+        "## Questões de Concurso",
+        "### Questão 1",
+        "**Enunciado da Questão:** First.",
+        "### Alternativas:",
+        "- A) Option A",
+        "### Questão 1",
+        "**Enunciado da Questão:** Second.",
+        "### Alternativas:",
+        "- A) Option A (gabarito)",
+    ]
+    parser = DocxParser()
+    report = parser.check_lines(lines)
+
+    assert report["contestQuestions"] == 2
+    assert report["questionsMissingAnswer"] == [1]
+    assert "Contest Question ID 1 is missing an answer." in report["warnings"]
+    assert "Contest Question ID 1 is missing an answer." in parser.parse_lines(lines)["warnings"]
+
+
+def test_check_uses_overridden_patterns():
+    """
+    Tests that overridden patterns without a '#'/'-' prefix are still classified.
+    """
+    parser = DocxParser(patterns={"course": r"^Course:\s*(.+)$", "subject": r"^Subject\s*\d+:\s*(.+)$"})
+    report = parser.check_lines(["Course: English", "Subject 1: Grammar"])
+
+    assert report["courseFound"]
+    assert report["subjects"] == 1
+
+    parser = DocxParser(patterns={"course": r"^#\s*Curso:\s*(.+)$|^Course:\s*(.+)$"})
+    assert parser.check_lines(["Course: X"])["courseFound"]
+    assert parser.check_lines(["# Curso: Y"])["courseFound"]
+
+
+def test_read_lines_matches_python_docx_breaks():
+    """
+    Tests that the fast reader renders line and page breaks like python-docx.
+    """
+    document = Document()
+    paragraph = document.add_paragraph()
+    paragraph.add_run("### Questão 3")
+    paragraph.add_run().add_break(WD_BREAK.PAGE)
+    paragraph.add_run("more")
+    paragraph = document.add_paragraph()
+    paragraph.add_run("first")
+    paragraph.add_run().add_break()
+    paragraph.add_run("second")
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    lines = _read_docx_lines(io.BytesIO(buffer.getvalue()))
+    assert lines == _parse_paragraph_text(Document(io.BytesIO(buffer.getvalue())).paragraphs)
+    assert lines == ["### Questão 3more", "first\nsecond"]
+
+
+def test_validate_endpoint_rejects_non_string_file():
+    """
+    Tests that /validate answers a JSON 400 when 'file' is not a string.
+    """
+    client = create_app().test_client()
+    for value in (123, None):
+        response = client.post("/validate", json={"file": value})
+        assert response.status_code == 400
+        assert "must be a base64-encoded string" in response.get_json()["error"]
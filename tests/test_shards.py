@@ -0,0 +1,125 @@
+"""
+Tests for the sharded output layout.
+"""
+import base64
+import json
+import os
+import subprocess
+import sys
+from benchmarks.synthetic import build_docx
+from parser.server import create_app
+from parser.shards import build_shards, load_manifest, read_contest_question, read_subject, write_shards
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), "..", "samples")
+NEW_JSON_PATH = os.path.join(SAMPLES_DIR, "sample_new_format.json")
+
+
+def _sample_document():
+    """Loads the sample document and adds extra items to span several shards."""
+    with open(NEW_JSON_PATH, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    document["subjects"].append({"subjectName": "Subject 2", "theorySlides": [], "exercises": []})
+    base = document["contestQuestions"][0]
+    document["contestQuestions"] = [dict(base, id=i, statement=f"Questão {i}") for i in range(1, 6)]
+    return document
+
+
+def test_build_shards_manifest():
+    """
+    Tests that the manifest counts and offsets point at the right items.
+    """
+    document = _sample_document()
+    manifest, shards = build_shards(document, shard_size=2)
+
+    assert manifest["counts"] == {"subjects": 2, "contestQuestions": 5}
+    assert sorted(shards) == [
+        "contest_questions/0001.jsonl",
+        "contest_questions/0002.jsonl",
+        "contest_questions/0003.jsonl",
+        "subjects/0001.json",
+        "subjects/0002.json",
+    ]
+    for entry in manifest["contestQuestions"]:
+        data = shards[entry["shard"]][entry["offset"] : entry["offset"] + entry["length"]]
+        assert json.loads(data)["id"] == entry["id"]
+
+
+def test_write_shards_random_access(tmp_path):
+    """
+    Tests reading a single subject and question back from a written layout.
+    """
+    document = _sample_document()
+    write_shards(document, str(tmp_path), shard_size=2)
+    manifest = load_manifest(str(tmp_path))
+
+    assert read_subject(str(tmp_path), "Subject 1", manifest) == document["subjects"][0]
+    assert read_contest_question(str(tmp_path), 4, manifest) == document["contestQuestions"][3]
+
+
+NON_ASCII_LINES = [
+    "# Curso: [Português]",
+    "## Caderno: [Caderno ção]",
+    "## Assunto 1: [Acentuação]",
+    "## Assunto 2: [Crase à]",
+    "## Questões de Concurso",
+    "### Questão 1",
+    "**Enunciado da Questão:** Questão ação",
+    "### Alternativas:",
+    "- A) Opção (gabarito)",
+    "### Questão 2",
+    "**Enunciado da Questão:** Questão ação",
+    "### Alternativas:",
+    "- A) Opção (gabarito)",
+]
+
+
+def test_parse_endpoint_sharded_random_access():
+    """
+    Tests that every manifest entry of a sharded /parse result slices the
+    right item out of its shard, with non-ASCII content.
+    """
+    client = create_app().test_client()
+    encoded = base64.b64encode(build_docx(NON_ASCII_LINES)).decode("utf-8")
+    response = client.post("/parse", json={"file": encoded, "layout": "sharded", "shardSize": 1})
+    assert response.status_code == 200
+    result = response.get_json()
+    shards = {path: base64.b64decode(content) for path, content in result["shards"].items()}
+
+    for entry in result["manifest"]["subjects"]:
+        data = shards[entry["shard"]][entry["offset"] : entry["offset"] + entry["length"]]
+        assert json.loads(data)["subjectName"] == entry["subjectName"]
+    for entry in result["manifest"]["contestQuestions"]:
+        data = shards[entry["shard"]][entry["offset"] : entry["offset"] + entry["length"]]
+        assert json.loads(data)["id"] == entry["id"]
+        assert json.loads(data)["statement"] == "Questão ação"
+    assert len(result["manifest"]["contestQuestions"]) == 2
+
+
+def test_cli_sharded_layout(tmp_path):
+    """
+    Tests that --layout sharded writes the manifest and shards to --output.
+    """
+    input_path = tmp_path / "input.docx"
+    input_path.write_bytes(build_docx(NON_ASCII_LINES))
+    out_dir = tmp_path / "out"
+    subprocess.run(
+        [sys.executable, "-m", "parser.cli", "-i", str(input_path), "-o", str(out_dir), "--layout", "sharded", "--shard-size", "1"],
+        check=True,
+        capture_output=True,
+        cwd=os.path.join(os.path.dirname(__file__), ".."),
+    )
+    manifest = load_manifest(str(out_dir))
+
+    assert manifest["counts"] == {"subjects": 2, "contestQuestions": 2}
+    assert read_subject(str(out_dir), "Crase à", manifest)["subjectName"] == "Crase à"
+    assert read_contest_question(str(out_dir), 2, manifest)["statement"] == "Questão ação"
+
+
+def test_parse_endpoint_rejects_boolean_shard_size():
+    """
+    Tests that a boolean shardSize is rejected rather than read as 1.
+    """
+    client = create_app().test_client()
+    encoded = base64.b64encode(build_docx(NON_ASCII_LINES)).decode("utf-8")
+    response = client.post("/parse", json={"file": encoded, "layout": "sharded", "shardSize": True})
+    assert response.status_code == 400